@@ -7,10 +7,9 @@ ATP_FILES_DIR = "data/external/atp"
 WTA_FILES_DIR = "data/external/wta"
 ATP_START_YEAR = 2000
 FILES_DIR = "data/"
+MATCH_STORE_DIR = "data/interim/matches"
 
 FORMAT_DATE = "%Y-%m-%d"
-TODAY = datetime.now()
-TOMORROW = TODAY + timedelta(days=1)
 
 ATP_SERIES_TO_RENAME = {
     "International Gold": "ATP500",
@@ -40,6 +39,15 @@ RANK_COLS = [
     "LRank",
 ]
 
+# Columns identifying a match: other columns (score, odds, ...) may be corrected afterwards
+MATCH_KEY_COLS = [
+    "Date",
+    "Tournament",
+    "Round",
+    "Winner",
+    "Loser",
+]
+
 ATP_SCORE_COLS = [
     "W1",
     "L1",
@@ -72,7 +80,40 @@ ODDS_COLS = [
     "B365L",
 ]
 
+# Columns fingerprinted to detect corrected matches: missing ones are hashed as empty
+MATCH_CONTENT_COLS = MATCH_KEY_COLS + ATP_SCORE_COLS + SETS_COLS + ODDS_COLS + RANK_COLS
+
 RANK_COLS = [
     "WRank",
     "LRank",
 ]
+
+
+def get_today() -> datetime:
+    """
+    Returns the current date and time, evaluated at call time.
+
+    Returns:
+        datetime: The current local date and time.
+    """
+    return datetime.now()
+
+
+def get_tomorrow() -> datetime:
+    """
+    Returns the current date and time shifted by one day, evaluated at call time.
+
+    Returns:
+        datetime: The current local date and time plus one day.
+    """
+    return get_today() + timedelta(days=1)
+
+
+def __getattr__(name: str) -> datetime:
+    # TODAY and TOMORROW are kept for backward compatibility but are evaluated on access,
+    # so they don't go stale in long-running processes
+    if name == "TODAY":
+        return get_today()
+    if name == "TOMORROW":
+        return get_tomorrow()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import numpy as np
 import pandas as pd
 
 from tennis_analysis_and_gambling.config import ATP_SCORE_COLS
@@ -7,6 +8,8 @@ from tennis_analysis_and_gambling.config import ODDS_COLS
 from tennis_analysis_and_gambling.config import RANK_COLS
 from tennis_analysis_and_gambling.config import SETS_COLS
 from tennis_analysis_and_gambling.config import WTA_SCORE_COLS
+from tennis_analysis_and_gambling.rating_history import build_rating_history
+from tennis_analysis_and_gambling.rating_history import RatingHistory
 
 
 def add_features_odds_ranks(df: pd.DataFrame):
@@ -87,7 +90,7 @@ def update_elo_rank(df: pd.DataFrame, initial_elo: int = 1500) -> pd.DataFrame:
     Updates the Elo ranking of tennis players based on match outcomes and stores the updated rankings in the DataFrame.
 
     Args:
-        df (pd.DataFrame): The DataFrame containing match data, with columns for the winner and loser of each match.
+        df (pd.DataFrame): The DataFrame containing match data, with columns "Date", "Winner" and "Loser".
         initial_elo (int, optional): The initial Elo rating assigned to all players. Defaults to 1500.
 
     Returns:
@@ -103,26 +106,85 @@ def update_elo_rank(df: pd.DataFrame, initial_elo: int = 1500) -> pd.DataFrame:
 
     Notes:
         - The function assumes that a separate `calculate_elo_ranking` function is available to handle the Elo ranking calculation.
-        - The Elo rating is updated iteratively for each match in the DataFrame.
+        - The Elo rating is updated iteratively for each match, in chronological order: matches sharing the same date
+          are processed in the order of the DataFrame. The rows themselves are not reordered.
         - The initial Elo rating can be adjusted via the `initial_elo` parameter.
+        - Use `update_elo_rank_with_history` to also get the rating trajectory of every player in the same pass.
     """
-    players = pd.concat([df["Winner"], df["Loser"]]).unique()
-    elo_dict = pd.Series(initial_elo, index=players)
-    for index, row in df.iterrows():
-        winner = row["Winner"]
-        loser = row["Loser"]
+    df, _ = update_elo_rank_with_history(df, initial_elo)
+    return df
+
+
+def build_elo_history(df: pd.DataFrame, initial_elo: int = 1500) -> RatingHistory:
+    """
+    Computes the Elo rating trajectory of every player, to answer as-of lookups and rankings for any date.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing match data, with columns "Date", "Winner" and "Loser".
+        initial_elo (int, optional): The initial Elo rating assigned to all players. Defaults to 1500.
+
+    Returns:
+        RatingHistory: The Elo rating of each player after each of his matches.
+
+    Notes:
+        - The Elo ratings are computed in the same way as `update_elo_rank`, so a rating as of a date never
+          depends on matches played after that date, whatever the order of the DataFrame.
+    """
+    _, _, history = _compute_elo(df, initial_elo)
+    return history
 
-        elo_winner = elo_dict[winner]
-        elo_loser = elo_dict[loser]
+
+def update_elo_rank_with_history(
+    df: pd.DataFrame, initial_elo: int = 1500
+) -> tuple[pd.DataFrame, RatingHistory]:
+    """
+    Combines `update_elo_rank` and `build_elo_history`, computing the Elo ratings only once.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing match data, with columns "Date", "Winner" and "Loser".
+        initial_elo (int, optional): The initial Elo rating assigned to all players. Defaults to 1500.
+
+    Returns:
+        tuple: A tuple containing:
+            - pd.DataFrame: The DataFrame with the "elo_Winner" and "elo_Loser" columns added.
+            - RatingHistory: The Elo rating of each player after each of his matches.
+    """
+    elo_winners, elo_losers, history = _compute_elo(df, initial_elo)
+    df["elo_Winner"] = elo_winners
+    df["elo_Loser"] = elo_losers
+    return df, history
+
+
+def _compute_elo(
+    df: pd.DataFrame, initial_elo: int
+) -> tuple[np.ndarray, np.ndarray, RatingHistory]:
+    # Matches are processed in chronological order, so that no rating depends on a later match.
+    # The sort is stable: matches played on the same date keep the order of the DataFrame
+    order = np.argsort(pd.to_datetime(df["Date"]).to_numpy(), kind="stable")
+    dates = df["Date"].to_numpy()[order]
+    winners = df["Winner"].to_numpy()[order]
+    losers = df["Loser"].to_numpy()[order]
+
+    players = pd.concat([df["Winner"], df["Loser"]]).unique()
+    elo_dict = pd.Series(initial_elo, index=players, dtype=float)
+    elo_winners = np.empty(len(df), dtype=np.float64)
+    elo_losers = np.empty(len(df), dtype=np.float64)
+    history_players, history_dates, history_ratings = [], [], []
+    for position, date, winner, loser in zip(order, dates, winners, losers):
+        elo_winners[position] = elo_dict[winner]
+        elo_losers[position] = elo_dict[loser]
 
         new_elo_winner, new_elo_loser = calculate_elo_ranking(winner, loser, elo_dict)
 
         elo_dict[winner] = new_elo_winner
         elo_dict[loser] = new_elo_loser
 
-        df.loc[index, "elo_Winner"] = elo_winner
-        df.loc[index, "elo_Loser"] = elo_loser
-    return df
+        history_players += [winner, loser]
+        history_dates += [date, date]
+        history_ratings += [new_elo_winner, new_elo_loser]
+
+    history = build_rating_history(history_players, history_dates, history_ratings)
+    return elo_winners, elo_losers, history
 
 
 def calculate_elo_ranking(winner: str, loser: str, elo_dict: dict, k_factor: int = 32):
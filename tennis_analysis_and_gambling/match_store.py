@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from os import listdir
+from os import makedirs
+from os import path
+from os import replace
+from os import stat
+
+import numpy as np
+import pandas as pd
+
+from tennis_analysis_and_gambling.config import MATCH_CONTENT_COLS
+from tennis_analysis_and_gambling.config import MATCH_KEY_COLS
+from tennis_analysis_and_gambling.config import MATCH_STORE_DIR
+
+KEY_HASH_COL = "_key_hash"
+ROW_HASH_COL = "_row_hash"
+INDEX_FILE = "index.npz"
+SEGMENT_PREFIX = "segment_"
+
+
+class MatchStore:
+    """
+    Persistent, append-only store of cleaned matches, deduplicated through a hash index.
+
+    Each match is identified by a fingerprint of its `key_cols` (date, tournament, round, winner and loser)
+    and its content by a fingerprint of its `content_cols` (score, odds, ranks). Ingesting a DataFrame only
+    appends the matches whose key is unknown ("new") or whose content changed, e.g. a corrected score
+    ("corrected"), as a new segment file.
+
+    Args:
+        store_dir (str, optional): The directory holding the segments and the hash index.
+                                   Defaults to MATCH_STORE_DIR.
+        key_cols (list, optional): The columns identifying a match. Defaults to MATCH_KEY_COLS.
+        content_cols (list, optional): The columns whose changes make a match "corrected".
+                                       Defaults to MATCH_CONTENT_COLS.
+
+    Notes:
+        - Segments are never rewritten: a corrected match is appended and supersedes the previous version
+          when the store is read.
+        - The hash index is kept in memory, so ingest cost scales with the ingested rows instead of the full
+          history. It is reloaded when the index file was rewritten by another instance on the same directory,
+          but ingests must not run concurrently.
+        - Columns are normalized before hashing ("Date" as datetime, numeric columns as float, others as
+          strings), so dtype drifts between refreshes of a file don't change the fingerprints. Columns
+          outside `key_cols` and `content_cols` are stored but not fingerprinted.
+    """
+
+    def __init__(
+        self,
+        store_dir: str = MATCH_STORE_DIR,
+        key_cols: list = MATCH_KEY_COLS,
+        content_cols: list = MATCH_CONTENT_COLS,
+    ):
+        self.store_dir = store_dir
+        self.key_cols = key_cols
+        self.content_cols = list(dict.fromkeys(key_cols + content_cols))
+        self._index = None
+        self._index_signature = None
+
+    @property
+    def index(self) -> dict:
+        """
+        The hash index of the store, mapping each match key hash to the hash of its latest content.
+        """
+        index_signature = self._get_index_signature()
+        if self._index is None or index_signature != self._index_signature:
+            self._index = self._read_index()
+            self._index_signature = index_signature
+        return self._index
+
+    def ingest(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Appends to the store the matches of a DataFrame which are new or corrected.
+
+        Args:
+            df (pd.DataFrame): The cleaned matches to ingest, e.g. a refreshed season file after `clean_atp`.
+
+        Returns:
+            pd.DataFrame: The delta, i.e. the inserted matches, with an extra column "Change" set to "new"
+                          or "corrected". Empty if nothing changed.
+
+        Notes:
+            - When a match appears several times in `df`, its last occurrence is kept.
+            - An input column named "Change" is overwritten in the delta, but stored unchanged.
+            - The segment is written before the hash index. If the process stops in between, the matches
+              are reported and appended again on next ingest, and `read` drops the duplicates.
+        """
+        df = df.reset_index(drop=True)
+        index = self.index
+        df_normalized = _normalize_cols(df.reindex(columns=self.content_cols))
+        key_hashes = pd.util.hash_pandas_object(
+            df_normalized[self.key_cols], index=False
+        ).to_numpy()
+        row_hashes = pd.util.hash_pandas_object(df_normalized, index=False).to_numpy()
+        last_occurrence = ~pd.Series(key_hashes).duplicated(keep="last").to_numpy()
+
+        changes = np.array(
+            [
+                _get_change(index.get(key), row)
+                for key, row in zip(key_hashes.tolist(), row_hashes.tolist())
+            ],
+            dtype=object,
+        )
+        inserted = last_occurrence & pd.notna(changes)
+
+        df_delta = df[inserted].copy()
+        if df_delta.empty:
+            df_delta["Change"] = pd.Series(dtype=object)
+            return df_delta
+
+        df_segment = df_delta.assign(
+            **{KEY_HASH_COL: key_hashes[inserted], ROW_HASH_COL: row_hashes[inserted]}
+        )
+        segment_name = f"{SEGMENT_PREFIX}{self._next_segment_id():05d}.pkl"
+        makedirs(self.store_dir, exist_ok=True)
+        df_segment.to_pickle(path.join(self.store_dir, segment_name))
+
+        index.update(zip(key_hashes[inserted].tolist(), row_hashes[inserted].tolist()))
+        self._write_index()
+
+        df_delta["Change"] = changes[inserted]
+        df_delta.reset_index(drop=True, inplace=True)
+        return df_delta
+
+    def read(self) -> pd.DataFrame:
+        """
+        Reads the current state of the store, keeping the latest version of each match.
+
+        Returns:
+            pd.DataFrame: The stored matches, in insertion order.
+        """
+        segments = self._list_segments()
+        if not segments:
+            return pd.DataFrame()
+
+        df = pd.concat(
+            [pd.read_pickle(path.join(self.store_dir, segment)) for segment in segments],
+            ignore_index=True,
+        )
+        df = df.drop_duplicates(subset=KEY_HASH_COL, keep="last")
+        df = df.drop(columns=[KEY_HASH_COL, ROW_HASH_COL])
+        df.reset_index(drop=True, inplace=True)
+        return df
+
+    def _list_segments(self) -> list:
+        if not path.isdir(self.store_dir):
+            return []
+        return sorted(
+            file
+            for file in listdir(self.store_dir)
+            if file.startswith(SEGMENT_PREFIX) and file.endswith(".pkl")
+        )
+
+    def _next_segment_id(self) -> int:
+        segments = self._list_segments()
+        if not segments:
+            return 0
+        return int(segments[-1].removeprefix(SEGMENT_PREFIX).removesuffix(".pkl")) + 1
+
+    def _get_index_signature(self) -> tuple:
+        # The index file is replaced on each write, so its inode changes even within the mtime resolution
+        index_path = path.join(self.store_dir, INDEX_FILE)
+        if not path.isfile(index_path):
+            return None
+        index_stat = stat(index_path)
+        return index_stat.st_ino, index_stat.st_mtime_ns, index_stat.st_size
+
+    def _read_index(self) -> dict:
+        index_path = path.join(self.store_dir, INDEX_FILE)
+        if not path.isfile(index_path):
+            return {}
+        with np.load(index_path, allow_pickle=False) as data:
+            return dict(zip(data["key_hashes"].tolist(), data["row_hashes"].tolist()))
+
+    def _write_index(self) -> None:
+        index_path = path.join(self.store_dir, INDEX_FILE)
+        tmp_path = path.join(self.store_dir, f"tmp_{INDEX_FILE}")
+        np.savez(
+            tmp_path,
+            key_hashes=np.fromiter(self._index.keys(), dtype=np.uint64, count=len(self._index)),
+            row_hashes=np.fromiter(self._index.values(), dtype=np.uint64, count=len(self._index)),
+        )
+        replace(tmp_path, index_path)
+        self._index_signature = self._get_index_signature()
+
+
+def _normalize_cols(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for col in df.columns:
+        if col == "Date" or pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col]).astype("datetime64[ns]")
+        elif pd.api.types.is_numeric_dtype(df[col]) or df[col].isna().all():
+            df[col] = df[col].astype("float64")
+        else:
+            df[col] = df[col].astype(str)
+    return df
+
+
+def _get_change(stored_row_hash, row_hash):
+    if stored_row_hash is None:
+        return "new"
+    if stored_row_hash != row_hash:
+        return "corrected"
+    return None
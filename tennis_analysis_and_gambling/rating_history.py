@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class RatingHistory:
+    """
+    Compact store of the Elo rating trajectory of every player.
+
+    The trajectories are kept in contiguous buffers: the ratings of player `players[i]` after each of
+    his matches are `ratings[offsets[i]:offsets[i + 1]]`, played on `dates[offsets[i]:offsets[i + 1]]`.
+
+    Attributes:
+        players (np.ndarray): The sorted names of the players.
+        offsets (np.ndarray): The start of each player's trajectory in `dates` and `ratings`, followed by
+                              the total number of entries (length: number of players + 1).
+        dates (np.ndarray): The dates of the matches, sorted within each player's trajectory.
+        ratings (np.ndarray): The Elo ratings of the players right after each match.
+
+    Notes:
+        - A player is considered unrated before his first match: his as-of rating is then NaN.
+        - When a player plays several matches on the same date, the rating after the last one is used.
+    """
+
+    players: np.ndarray
+    offsets: np.ndarray
+    dates: np.ndarray
+    ratings: np.ndarray
+
+    def rating_as_of(self, player: str, date) -> float:
+        """
+        Returns the Elo rating of a player after all his matches played on or before a given date.
+
+        Args:
+            player (str): The name of the player.
+            date: The date of the lookup, as any value accepted by `pd.Timestamp`.
+
+        Returns:
+            float: The Elo rating of the player, or NaN if he had not played any match yet.
+
+        Raises:
+            KeyError: If the player is not in the history.
+        """
+        player_idx = np.searchsorted(self.players, player)
+        if player_idx == len(self.players) or self.players[player_idx] != player:
+            raise KeyError(f"{player} not found in rating history")
+
+        start, end = self.offsets[player_idx], self.offsets[player_idx + 1]
+        nb_matches = np.searchsorted(self.dates[start:end], _to_datetime64(date), side="right")
+        if nb_matches == 0:
+            return np.nan
+        return float(self.ratings[start + nb_matches - 1])
+
+    def ranking_as_of(self, date, top_n: int = None) -> pd.DataFrame:
+        """
+        Ranks all players by their Elo rating after all matches played on or before a given date.
+
+        Args:
+            date: The date of the ranking, as any value accepted by `pd.Timestamp`.
+            top_n (int, optional): The number of best players to keep. Defaults to None, in which case
+                                   every rated player is returned.
+
+        Returns:
+            pd.DataFrame: A DataFrame with columns "Player" and "Elo", sorted by decreasing Elo rating
+                          and indexed by rank starting at 1.
+        """
+        # `build_rating_history` ensures the dates are sorted within each trajectory, so the number of
+        # matches played by each player up to `date` gives the position of his as-of rating in `ratings`
+        played = self.dates <= _to_datetime64(date)
+        nb_matches = np.add.reduceat(played.astype(np.int64), self.offsets[:-1])
+        rated = nb_matches > 0
+
+        df_ranking = pd.DataFrame(
+            {
+                "Player": self.players[rated],
+                "Elo": self.ratings[self.offsets[:-1][rated] + nb_matches[rated] - 1],
+            }
+        )
+        df_ranking = df_ranking.sort_values("Elo", ascending=False, kind="stable")
+        if top_n is not None:
+            df_ranking = df_ranking.head(top_n)
+        df_ranking.index = pd.RangeIndex(1, len(df_ranking) + 1, name="Rank")
+        return df_ranking
+
+    def save(self, file_name: str) -> None:
+        """
+        Saves the rating history to disk in NumPy `.npz` format.
+
+        Args:
+            file_name (str): The path of the file to write.
+        """
+        np.savez(
+            file_name,
+            players=self.players,
+            offsets=self.offsets,
+            dates=self.dates,
+            ratings=self.ratings,
+        )
+
+    @classmethod
+    def load(cls, file_name: str) -> "RatingHistory":
+        """
+        Loads a rating history previously saved with `RatingHistory.save`.
+
+        Args:
+            file_name (str): The path of the `.npz` file to read.
+
+        Returns:
+            RatingHistory: The loaded rating history.
+        """
+        with np.load(file_name, allow_pickle=False) as data:
+            return cls(
+                players=data["players"],
+                offsets=data["offsets"],
+                dates=data["dates"],
+                ratings=data["ratings"],
+            )
+
+
+def build_rating_history(players: list, dates: list, ratings: list) -> RatingHistory:
+    """
+    Builds a RatingHistory from rating updates listed in chronological order.
+
+    Args:
+        players (list): The name of the player rated by each update.
+        dates (list): The date of the match of each update.
+        ratings (list): The Elo rating of the player after each update.
+
+    Returns:
+        RatingHistory: The rating history grouping the updates by player.
+
+    Raises:
+        ValueError: If the updates of a player are not in chronological order.
+
+    Notes:
+        - The updates are only grouped by player, never sorted by date: each rating depends on the matches
+          processed before it, so sorting them afterwards would leak later matches into earlier dates.
+    """
+    player_names, player_codes = np.unique(np.asarray(players, dtype=str), return_inverse=True)
+    dates = pd.to_datetime(pd.Series(dates)).to_numpy(dtype="datetime64[ns]")
+    # The sort is stable, so each player's updates keep the order in which they are listed
+    order = np.argsort(player_codes, kind="stable")
+    counts = np.bincount(player_codes, minlength=len(player_names))
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    dates = dates[order]
+    same_player = player_codes[order][1:] == player_codes[order][:-1]
+    if (same_player & (dates[1:] < dates[:-1])).any():
+        raise ValueError("Rating updates must be listed in chronological order")
+
+    return RatingHistory(
+        players=player_names,
+        offsets=offsets,
+        dates=dates,
+        ratings=np.asarray(ratings, dtype=np.float64)[order],
+    )
+
+
+def _to_datetime64(date) -> np.datetime64:
+    return pd.Timestamp(date).to_datetime64().astype("datetime64[ns]")
@@ -1,18 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+
 from datetime import datetime
 from os import listdir
 from os import makedirs
 from os import path
+from typing import TYPE_CHECKING
 
 import pandas as pd
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from tennis_analysis_and_gambling.config import ATP_FILES_DIR
 from tennis_analysis_and_gambling.config import ATP_START_YEAR
@@ -20,6 +16,12 @@ from tennis_analysis_and_gambling.config import FILES_XPATH
 from tennis_analysis_and_gambling.config import URL_HISTORY_FILES
 from tennis_analysis_and_gambling.config import WTA_FILES_DIR
 
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
+
+# selenium and requests are only needed to download history files: they are imported
+# inside the functions using them so that loading and cleaning data stays lightweight
+
 
 def set_driver(url: str) -> WebDriver:
     """
@@ -37,6 +39,9 @@ def set_driver(url: str) -> WebDriver:
         - "--remote-debugging-port=9222": Opens a port for remote debugging.
         - "--disable-gpu": Disables GPU usage, useful in environments without GPU access.
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     chrome_options = Options()
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--headless")
@@ -48,6 +53,8 @@ def set_driver(url: str) -> WebDriver:
 
 
 def save_file_from_url(file_url: str, file_name: str):
+    import requests
+
     response = requests.get(file_url)
     with open(file_name, "wb") as file:
         file.write(response.content)
@@ -91,6 +98,10 @@ def fetch_history_file(year: int, atp_or_wta: str) -> None:
     if suffix < 1:
         raise FileNotFoundError(f"No file found for {atp_or_wta} {year}")
 
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     driver = set_driver(url=URL_HISTORY_FILES)
     try:
         wait = WebDriverWait(driver, 3)
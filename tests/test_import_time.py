@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import json
+import subprocess
+import sys
+import unittest
+
+# Modules which must be importable without network/browser dependencies
+LIGHTWEIGHT_MODULES = [
+    "tennis_analysis_and_gambling.config",
+    "tennis_analysis_and_gambling.cleaning",
+    "tennis_analysis_and_gambling.feature_engineering",
+    "tennis_analysis_and_gambling.match_store",
+    "tennis_analysis_and_gambling.rating_history",
+    "tennis_analysis_and_gambling.utils",
+]
+HEAVY_DEPENDENCIES = ["selenium", "requests"]
+# Time budget (in seconds) for importing the package modules, on top of pandas and numpy
+IMPORT_TIME_BUDGET = 0.2
+
+BENCHMARK_SCRIPT = f"""
+import importlib
+import json
+import sys
+import time
+
+import numpy
+import pandas
+
+start = time.perf_counter()
+for module in {LIGHTWEIGHT_MODULES!r}:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+
+loaded = [dep for dep in {HEAVY_DEPENDENCIES!r} if dep in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+def run_import_benchmark() -> dict:
+    """
+    Imports the lightweight modules of the package in a fresh interpreter and measures the import time.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - "elapsed": The time in seconds spent importing the package modules.
+            - "loaded": The heavy dependencies found in `sys.modules` after the imports.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", BENCHMARK_SCRIPT], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.benchmark = run_import_benchmark()
+
+    def test_no_heavy_dependencies_imported(self):
+        self.assertEqual(self.benchmark["loaded"], [])
+
+    def test_import_time_budget(self):
+        self.assertLess(self.benchmark["elapsed"], IMPORT_TIME_BUDGET)
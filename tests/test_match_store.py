@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import tempfile
+import unittest
+from os import path
+from os import remove
+
+import pandas as pd
+
+from tennis_analysis_and_gambling.match_store import MatchStore
+
+
+class TestMatchStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = MatchStore(store_dir=self.tmp_dir.name)
+        data_atp = {
+            "Date": pd.to_datetime(["2023-01-10", "2023-01-12", "2023-01-15"]),
+            "Tournament": ["Adelaide", "Adelaide", "Australian Open"],
+            "Round": ["1st Round", "2nd Round", "1st Round"],
+            "Winner": ["Player A", "Player B", "Player C"],
+            "Loser": ["Player B", "Player C", "Player B"],
+            "W1": [6.0, 6.0, 6.0],
+            "L1": [2.0, 4.0, 0.0],
+        }
+        self.df_test_atp = pd.DataFrame(data=data_atp)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_ingest_new_matches(self):
+        df_delta = self.store.ingest(self.df_test_atp)
+        self.assertEqual(len(df_delta), 3)
+        self.assertTrue((df_delta["Change"] == "new").all())
+        pd.testing.assert_frame_equal(self.store.read(), self.df_test_atp)
+
+    def test_ingest_is_idempotent(self):
+        self.store.ingest(self.df_test_atp)
+        df_delta = self.store.ingest(self.df_test_atp)
+        self.assertTrue(df_delta.empty)
+        self.assertEqual(len(self.store.read()), 3)
+
+    def test_ingest_delta_only(self):
+        self.store.ingest(self.df_test_atp.iloc[:2])
+
+        df_refreshed = self.df_test_atp.copy()
+        df_refreshed.loc[1, "L1"] = 3.0  # corrected score
+        df_delta = MatchStore(store_dir=self.tmp_dir.name).ingest(df_refreshed)
+
+        self.assertEqual(df_delta["Winner"].tolist(), ["Player B", "Player C"])
+        self.assertEqual(df_delta["Change"].tolist(), ["corrected", "new"])
+
+        df_stored = self.store.read()
+        self.assertEqual(len(df_stored), 3)
+        self.assertEqual(df_stored.loc[df_stored["Winner"] == "Player B", "L1"].item(), 3.0)
+
+    def test_ingest_dtype_drift(self):
+        self.store.ingest(self.df_test_atp)
+
+        df_refreshed = self.df_test_atp.copy()
+        df_refreshed["W1"] = df_refreshed["W1"].astype(int)
+        df_refreshed["Date"] = df_refreshed["Date"].dt.strftime("%Y-%m-%d")
+        df_delta = self.store.ingest(df_refreshed)
+
+        self.assertTrue(df_delta.empty)
+        self.assertEqual(len(self.store.read()), 3)
+
+    def test_ingest_extra_column(self):
+        self.store.ingest(self.df_test_atp)
+
+        df_refreshed = self.df_test_atp.assign(WPts=[1000.0, float("nan"), 250.0])
+        df_delta = self.store.ingest(df_refreshed)
+
+        self.assertTrue(df_delta.empty)
+
+    def test_ingest_after_lost_index(self):
+        self.store.ingest(self.df_test_atp)
+        # Simulates a crash between the segment and the index writes
+        remove(path.join(self.tmp_dir.name, "index.npz"))
+
+        df_delta = MatchStore(store_dir=self.tmp_dir.name).ingest(self.df_test_atp)
+        self.assertEqual(len(df_delta), 3)
+        pd.testing.assert_frame_equal(self.store.read(), self.df_test_atp)
+
+    def test_ingest_from_several_instances(self):
+        other_store = MatchStore(store_dir=self.tmp_dir.name)
+        self.store.ingest(self.df_test_atp.iloc[:2])
+        df_delta = other_store.ingest(self.df_test_atp)
+        self.assertEqual(df_delta["Winner"].tolist(), ["Player C"])
+
+        # The first instance sees the match stored by the other one
+        df_delta = self.store.ingest(self.df_test_atp)
+        self.assertTrue(df_delta.empty)
+        self.assertEqual(len(self.store.read()), 3)
+
+    def test_ingest_duplicated_rows(self):
+        df_duplicated = pd.concat([self.df_test_atp, self.df_test_atp.iloc[[0]]])
+        df_delta = self.store.ingest(df_duplicated)
+        self.assertEqual(len(df_delta), 3)
+
+    def test_read_empty_store(self):
+        self.assertTrue(self.store.read().empty)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import tempfile
+import unittest
+from os import path
+
+import numpy as np
+import pandas as pd
+
+from tennis_analysis_and_gambling.feature_engineering import build_elo_history
+from tennis_analysis_and_gambling.feature_engineering import update_elo_rank
+from tennis_analysis_and_gambling.feature_engineering import update_elo_rank_with_history
+from tennis_analysis_and_gambling.rating_history import build_rating_history
+from tennis_analysis_and_gambling.rating_history import RatingHistory
+
+
+class TestRatingHistory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        data_atp = {
+            "Date": pd.to_datetime(["2023-01-10", "2023-01-12", "2023-01-12", "2023-01-15"]),
+            "Winner": ["Player A", "Player B", "Player A", "Player C"],
+            "Loser": ["Player B", "Player C", "Player C", "Player A"],
+        }
+        self.df_test_atp, self.history = update_elo_rank_with_history(pd.DataFrame(data=data_atp))
+
+    def test_history_layout(self):
+        np.testing.assert_array_equal(self.history.players, ["Player A", "Player B", "Player C"])
+        np.testing.assert_array_equal(self.history.offsets, [0, 3, 5, 8])
+        self.assertEqual(self.history.ratings[0], 1516)
+        self.assertEqual(self.history.ratings[3], 1484)
+
+    def test_rating_as_of(self):
+        self.assertTrue(np.isnan(self.history.rating_as_of("Player C", "2023-01-11")))
+        self.assertEqual(self.history.rating_as_of("Player A", "2023-01-10"), 1516)
+        self.assertEqual(self.history.rating_as_of("Player A", "2023-01-11"), 1516)
+        # Last match of the day is used
+        self.assertEqual(
+            self.history.rating_as_of("Player C", "2023-01-12"),
+            self.df_test_atp.loc[3, "elo_Winner"],
+        )
+
+    def test_rating_as_of_unknown_player(self):
+        with self.assertRaises(KeyError):
+            self.history.rating_as_of("Player Z", "2023-01-12")
+
+    def test_ranking_as_of(self):
+        df_ranking = self.history.ranking_as_of("2023-01-10")
+        self.assertEqual(df_ranking["Player"].tolist(), ["Player A", "Player B"])
+        self.assertEqual(df_ranking["Elo"].tolist(), [1516, 1484])
+        self.assertEqual(df_ranking.index.tolist(), [1, 2])
+
+        df_ranking = self.history.ranking_as_of("2023-01-31", top_n=1)
+        self.assertEqual(len(df_ranking), 1)
+        self.assertEqual(
+            df_ranking["Elo"].iloc[0],
+            max(self.history.rating_as_of(p, "2023-01-31") for p in self.history.players),
+        )
+
+    def test_ranking_matches_rating_as_of(self):
+        for date in ["2023-01-09", "2023-01-10", "2023-01-11", "2023-01-12", "2023-01-31"]:
+            df_ranking = self.history.ranking_as_of(date)
+            for player in self.history.players:
+                expected_elo = self.history.rating_as_of(player, date)
+                if np.isnan(expected_elo):
+                    self.assertNotIn(player, df_ranking["Player"].tolist())
+                else:
+                    self.assertEqual(
+                        df_ranking.loc[df_ranking["Player"] == player, "Elo"].item(), expected_elo
+                    )
+
+    def test_non_chronological_input(self):
+        data_atp = {
+            "Date": pd.to_datetime(["2024-01-10", "2023-01-10", "2023-01-12"]),
+            "Winner": ["Player A", "Player A", "Player A"],
+            "Loser": ["Player B", "Player C", "Player D"],
+        }
+        df_test_atp = pd.DataFrame(data=data_atp)
+        history = build_elo_history(df_test_atp)
+        df_sorted = update_elo_rank(df_test_atp.sort_values("Date").reset_index(drop=True))
+
+        # Player A's ratings after his 2023 matches, then after his 2024 match
+        elo_first_match = df_sorted.loc[1, "elo_Winner"]
+        elo_second_match = df_sorted.loc[2, "elo_Winner"]
+        self.assertEqual(history.rating_as_of("Player A", "2023-01-10"), elo_first_match)
+        self.assertEqual(history.rating_as_of("Player A", "2023-06-01"), elo_second_match)
+
+        df_ranking = history.ranking_as_of("2023-06-01")
+        self.assertEqual(
+            df_ranking.loc[df_ranking["Player"] == "Player A", "Elo"].item(), elo_second_match
+        )
+        self.assertNotIn("Player B", df_ranking["Player"].tolist())
+
+        # After the last match, the as-of rating is the final rating
+        elo_final = history.ratings[history.offsets[1] - 1]
+        self.assertAlmostEqual(elo_final, 1545.83, places=2)
+        self.assertEqual(history.rating_as_of("Player A", "2025-01-01"), elo_final)
+        df_ranking = history.ranking_as_of("2025-01-01")
+        self.assertEqual(
+            df_ranking.loc[df_ranking["Player"] == "Player A", "Elo"].item(), elo_final
+        )
+
+    def test_update_elo_rank_keeps_rows_order(self):
+        data_atp = {
+            "Date": pd.to_datetime(["2024-01-10", "2023-01-10"]),
+            "Winner": ["Player A", "Player A"],
+            "Loser": ["Player B", "Player C"],
+        }
+        df_elo = update_elo_rank(pd.DataFrame(data=data_atp))
+        self.assertEqual(df_elo["Loser"].tolist(), ["Player B", "Player C"])
+        self.assertEqual(df_elo["elo_Winner"].tolist(), [1516, 1500])
+
+    def test_build_rating_history_non_chronological(self):
+        with self.assertRaises(ValueError):
+            build_rating_history(
+                ["Player A", "Player A"], ["2024-01-10", "2023-01-10"], [1516, 1531]
+            )
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = path.join(tmp_dir, "elo_history.npz")
+            self.history.save(file_name)
+            history_loaded = RatingHistory.load(file_name)
+
+        np.testing.assert_array_equal(history_loaded.players, self.history.players)
+        np.testing.assert_array_equal(history_loaded.offsets, self.history.offsets)
+        np.testing.assert_array_equal(history_loaded.dates, self.history.dates)
+        np.testing.assert_array_equal(history_loaded.ratings, self.history.ratings)